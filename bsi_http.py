@@ -0,0 +1,66 @@
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BSI = "https://www.bsi.bund.de/DE/Themen/Unternehmen-und-Organisationen/Cyber-Sicherheitslage"
+CTI = "/Analysen-und-Prognosen/Threat-Intelligence"
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Accept-Encoding': 'gzip, deflate, br',
+}
+TIMEOUT = (5, 30)
+
+RETRIES = Retry(
+    total=5,
+    connect=5,
+    read=5,
+    backoff_factor=1,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=True,
+)
+
+def create_session():
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(max_retries=RETRIES)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+SESSION = create_session()
+
+def clean_text(text):
+    return " ".join(text.split()) if text else ""
+
+def fetch(url, state):
+    response = SESSION.get(url, headers=conditional_headers(state), timeout=TIMEOUT)
+    content = None if response.status_code == 304 else response.content
+    return content, response.headers
+
+def load_state(state_file):
+    try:
+        with open(state_file, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def conditional_headers(state):
+    headers = {}
+    if state.get("etag"):
+        headers['If-None-Match'] = state["etag"]
+    if state.get("last_modified"):
+        headers['If-Modified-Since'] = state["last_modified"]
+    return headers
+
+def save_state(state_file, response_headers, digest):
+    state = {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+        "body_sha256": digest,
+    }
+    with open(state_file, 'wb') as f:
+        f.write(orjson.dumps(
+            state,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE))
@@ -0,0 +1,43 @@
+import asyncio
+
+import aiohttp
+
+import scrape_apt
+import scrape_crime
+from bsi_http import BSI, CTI, HEADERS, RETRIES, conditional_headers
+
+APT_URL = BSI + CTI + scrape_apt.GROUPS_PAGE
+CRIME_URL = BSI + CTI + scrape_crime.GROUPS_PAGE
+
+async def fetch(session, url, state):
+    timeout = aiohttp.ClientTimeout(total=30)
+    headers = conditional_headers(state)
+    for attempt in range(RETRIES.total):
+        if attempt:
+            await asyncio.sleep(2 ** (attempt - 1))
+        try:
+            async with session.get(url, timeout=timeout, headers=headers) as response:
+                if response.status == 304:
+                    return None, response.headers
+                response.raise_for_status()
+                return await response.read(), response.headers
+        except aiohttp.ClientResponseError as exc:
+            if attempt == RETRIES.total - 1 or exc.status not in RETRIES.status_forcelist:
+                raise
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == RETRIES.total - 1:
+                raise
+
+async def main():
+    apt_state = scrape_apt.load_cache_state()
+    crime_state = scrape_crime.load_cache_state()
+    async with aiohttp.ClientSession(headers=HEADERS) as session:
+        (apt_content, apt_headers), (crime_content, crime_headers) = await asyncio.gather(
+            fetch(session, APT_URL, apt_state),
+            fetch(session, CRIME_URL, crime_state),
+        )
+    scrape_apt.write_to_file(scrape_apt.parse_response(apt_content, apt_headers, apt_state))
+    scrape_crime.write_to_file(scrape_crime.parse_response(crime_content, crime_headers, crime_state))
+
+if __name__ == "__main__":
+    asyncio.run(main())
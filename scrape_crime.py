@@ -1,41 +1,68 @@
-import json
-import requests
-from bs4 import BeautifulSoup, element
+import hashlib
+import os.path
+import orjson
+import lxml.html
+from lxml import etree
+
+from bsi_http import BSI, CTI, clean_text, fetch, load_state, save_state
 
-BSI = "https://www.bsi.bund.de/DE/Themen/Unternehmen-und-Organisationen/Cyber-Sicherheitslage"
-CTI = "/Analysen-und-Prognosen/Threat-Intelligence"
 GROUPS_PAGE = "/Aktive-Crime-Gruppen/aktive-crime-gruppen_node.html"
+OUT_FILE = "groups_crime.json"
+STATE_FILE = "etag_crime.json"
+
+_HTML_PARSER = lxml.html.HTMLParser(collect_ids=False)
+_GROUPS_TABLE = etree.XPath('//table[contains(@class, "alternativ2")]')
+_HEADER_CELLS = etree.XPath('./thead//th')
+_BODY_ROWS = etree.XPath('./tbody/tr')
+_ROW_CELLS = etree.XPath('./td')
 
 def write_to_file(out_data):
-    with open("groups_crime.json", 'w+', encoding="utf-8") as f:
-        json.dump(out_data, f, indent=2, sort_keys=True, ensure_ascii=False)
-        f.write('\n')
+    with open(OUT_FILE, 'wb') as f:
+        f.write(orjson.dumps(
+            out_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE))
+
+def read_cached():
+    with open(OUT_FILE, 'rb') as f:
+        return orjson.loads(f.read())
 
-def parse_table(table: element):
+def load_cache_state():
+    if not os.path.exists(OUT_FILE):
+        return {}
+    return load_state(STATE_FILE)
+
+def parse_table(table: lxml.html.HtmlElement):
     headers = []
-    for header in table.find('thead').find_all('th'):
-        headers.append(header.text.replace('\n', ''))
+    for header in _HEADER_CELLS(table):
+        headers.append(header.text_content().replace('\n', ''))
     groups_data = []
-    for row in table.find('tbody').find_all('tr'):
-        group_cells = []
-        for cell in row.find_all('td'):
-            if "\n" in cell.text:
-                group_cells.append(cell.text.replace('\n', ' '))
-            else:
-                group_cells.append(cell.text)
-        groups_data.append({headers[i]: cell for i, cell in enumerate(group_cells)})
+    clean = clean_text
+    row_cells = _ROW_CELLS
+    for row in _BODY_ROWS(table):
+        group_cells = [clean(cell.text_content()) for cell in row_cells(row)]
+        groups_data.append(dict(zip(headers, group_cells)))
     return groups_data
 
 def get_table_data(html_response):
-    soup = BeautifulSoup(html_response, "html.parser")
-    groups_table = soup.find_all("table", {"class": "alternativ2"})[0]
+    tree = lxml.html.fromstring(html_response, parser=_HTML_PARSER)
+    groups_table = _GROUPS_TABLE(tree)[0]
     return parse_table(table=groups_table)
 
+def parse_response(content, response_headers, state):
+    if content is None:
+        return read_cached()
+    digest = hashlib.sha256(content).hexdigest()
+    if digest == state.get("body_sha256") and os.path.exists(OUT_FILE):
+        return read_cached()
+    out_data = get_table_data(html_response=content)
+    save_state(STATE_FILE, response_headers, digest)
+    return out_data
+
 def main():
     url = BSI + CTI + GROUPS_PAGE
-    headers = {'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0'}
-    response = requests.get(url, headers=headers, timeout=10)
-    return get_table_data(html_response=response.text)
+    state = load_cache_state()
+    content, response_headers = fetch(url, state)
+    return parse_response(content, response_headers, state)
 
 if __name__ == "__main__":
     new_data = main()